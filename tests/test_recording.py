@@ -0,0 +1,68 @@
+import contextlib
+import io
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from xauusd_bot.bot import run_live
+from xauusd_bot.config import BotConfig
+from xauusd_bot.data_provider import generate_mock_data
+from xauusd_bot.models import Candle
+from xauusd_bot.recording import ReplayClient, SessionRecorder, VirtualClock
+
+
+class _FakeClient:
+    def __init__(self, prices: list[float]) -> None:
+        self.daily = generate_mock_data(points=60)
+        self.prices = prices
+        self.calls = 0
+
+    def fetch_daily(self) -> list[Candle]:
+        return self.daily
+
+    def latest_price(self) -> Candle:
+        price = self.prices[self.calls]
+        ts = datetime(2024, 1, 1) + timedelta(minutes=5 * self.calls)
+        self.calls += 1
+        return Candle(timestamp=ts, open=price, high=price, low=price, close=price)
+
+
+class RecordingTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "session.log"
+        self.prices = [2000 + (idx % 7) * 1.37 - idx * 0.1 for idx in range(50)]
+        client = _FakeClient(self.prices)
+        with SessionRecorder(client, self.path) as recorder:
+            recorder.fetch_daily()
+            self.recorded = [recorder.latest_price() for _ in self.prices]
+        self.daily = client.daily
+
+    def test_replay_round_trips_recorded_data(self) -> None:
+        replay = ReplayClient(self.path)
+        self.assertEqual(self.daily, replay.fetch_daily())
+        self.assertEqual(self.recorded, [replay.latest_price() for _ in self.prices])
+
+    def test_replay_runs_live_loop_with_virtual_clock(self) -> None:
+        config = BotConfig()
+        summaries = []
+        for _ in range(2):
+            clock = VirtualClock()
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                summaries.append(
+                    run_live(
+                        config,
+                        loop=True,
+                        client=ReplayClient(self.path),
+                        sleep=clock.sleep,
+                    )
+                )
+            self.assertEqual(len(self.prices), len(out.getvalue().splitlines()))
+            self.assertEqual(config.poll_interval * len(self.prices), clock.elapsed)
+        self.assertEqual(summaries[0], summaries[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
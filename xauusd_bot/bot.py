@@ -4,10 +4,18 @@ import argparse
 import sys
 import time
 from collections import deque
+from collections.abc import Callable
 
 from .config import BotConfig
 from .data_provider import AlphaVantageClient, MarketDataError, generate_mock_data
 from .models import Candle
+from .recording import (
+    PriceClient,
+    RecordingExhausted,
+    ReplayClient,
+    SessionRecorder,
+    VirtualClock,
+)
 from .strategy import MovingAverageRsiStrategy
 from .trader import PaperBroker
 
@@ -31,6 +39,19 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Usa datos sintéticos incluso si se dispone de API key.",
     )
+    parser.add_argument(
+        "--record",
+        metavar="ARCHIVO",
+        help="En modo live, graba cada cotización recibida en ARCHIVO.",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="ARCHIVO",
+        help=(
+            "Reproduce una sesión grabada con --record sin red y con reloj "
+            "virtual (sin esperas entre sondeos)."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -54,17 +75,14 @@ def run_backtest(config: BotConfig, candles: list[Candle]) -> dict[str, float |
     return broker.summary()
 
 
-def run_live(config: BotConfig, loop: bool) -> None:
-    if not config.alpha_vantage_key:
-        raise SystemExit(
-            "Se requiere ALPHA_VANTAGE_KEY en modo live. "
-            "Ejecuta en modo --backtest o usa --mock."
-        )
-    client = AlphaVantageClient(
-        api_key=config.alpha_vantage_key,
-        from_symbol=config.from_symbol,
-        to_symbol=config.to_symbol,
-    )
+def run_live(
+    config: BotConfig,
+    loop: bool,
+    client: PriceClient | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, float | int]:
+    if client is None:
+        client = _live_client(config)
     candles = client.fetch_daily()
     history = deque(candles[-config.slow_ma * 2 :], maxlen=config.slow_ma * 2)
     strategy = MovingAverageRsiStrategy(
@@ -80,7 +98,10 @@ def run_live(config: BotConfig, loop: bool) -> None:
         stop_loss_pct=config.stop_loss_pct,
     )
     while True:
-        candle = client.latest_price()
+        try:
+            candle = client.latest_price()
+        except RecordingExhausted:
+            break
         history.append(candle)
         signal = strategy.generate_signal(history)
         broker.on_signal(signal, candle)
@@ -91,7 +112,21 @@ def run_live(config: BotConfig, loop: bool) -> None:
         )
         if not loop:
             break
-        time.sleep(config.poll_interval.total_seconds())
+        sleep(config.poll_interval.total_seconds())
+    return broker.summary()
+
+
+def _live_client(config: BotConfig) -> AlphaVantageClient:
+    if not config.alpha_vantage_key:
+        raise SystemExit(
+            "Se requiere ALPHA_VANTAGE_KEY en modo live. "
+            "Ejecuta en modo --backtest o usa --mock."
+        )
+    return AlphaVantageClient(
+        api_key=config.alpha_vantage_key,
+        from_symbol=config.from_symbol,
+        to_symbol=config.to_symbol,
+    )
 
 
 def main() -> None:
@@ -106,6 +141,20 @@ def main() -> None:
         summary = run_backtest(config, candles)
         print("Resumen backtest:", summary)
         return
+    if args.replay:
+        clock = VirtualClock()
+        summary = run_live(
+            config,
+            loop=args.loop,
+            client=ReplayClient(args.replay),
+            sleep=clock.sleep,
+        )
+        print(f"Resumen replay ({clock.elapsed} simulados):", summary)
+        return
+    if args.record:
+        with SessionRecorder(_live_client(config), args.record) as recorder:
+            run_live(config, loop=args.loop, client=recorder)
+        return
     run_live(config, loop=args.loop)
 
 
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, Protocol
+
+from .data_provider import MarketDataError
+from .models import Candle
+
+# Formato del fichero de sesión: una línea de texto por evento, campos
+# separados por espacios. Los precios se escriben con ``repr`` para que la
+# reproducción sea bit a bit idéntica a la sesión original.
+#   D <timestamp> <open> <high> <low> <close>   vela diaria inicial
+#   Q <timestamp> <precio>                      cotización de latest_price()
+_DAILY = "D"
+_QUOTE = "Q"
+
+
+class PriceClient(Protocol):
+    def fetch_daily(self) -> list[Candle]: ...
+
+    def latest_price(self) -> Candle: ...
+
+
+class RecordingExhausted(Exception):
+    """Se han consumido todas las cotizaciones de la sesión grabada."""
+
+
+class SessionRecorder:
+    """Envuelve un cliente de datos y graba cada respuesta en un fichero."""
+
+    def __init__(self, client: PriceClient, path: str | Path) -> None:
+        self.client = client
+        self.path = Path(path)
+        self._file: IO[str] = self.path.open("w", encoding="utf-8")
+
+    def fetch_daily(self) -> list[Candle]:
+        candles = self.client.fetch_daily()
+        for candle in candles:
+            self._write(
+                _DAILY,
+                candle.timestamp.isoformat(),
+                repr(candle.open),
+                repr(candle.high),
+                repr(candle.low),
+                repr(candle.close),
+            )
+        return candles
+
+    def latest_price(self) -> Candle:
+        candle = self.client.latest_price()
+        self._write(_QUOTE, candle.timestamp.isoformat(), repr(candle.close))
+        return candle
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _write(self, *fields: str) -> None:
+        # Se vuelca línea a línea para no perder datos si el bot se interrumpe.
+        self._file.write(" ".join(fields) + "\n")
+        self._file.flush()
+
+
+class ReplayClient:
+    """Reproduce una sesión grabada con la misma interfaz que el cliente real."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.daily: list[Candle] = []
+        self.quotes: list[Candle] = []
+        self._cursor = 0
+        with Path(path).open(encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    self._parse_line(line.split())
+                except (IndexError, ValueError) as exc:
+                    raise MarketDataError(
+                        f"Línea {lineno} inválida en la sesión grabada: {exc}"
+                    ) from exc
+
+    def _parse_line(self, fields: list[str]) -> None:
+        kind, timestamp, *prices = fields
+        ts = datetime.fromisoformat(timestamp)
+        if kind == _DAILY:
+            open_price, high, low, close = map(float, prices)
+            self.daily.append(
+                Candle(timestamp=ts, open=open_price, high=high, low=low, close=close)
+            )
+        elif kind == _QUOTE:
+            (price,) = map(float, prices)
+            self.quotes.append(
+                Candle(timestamp=ts, open=price, high=price, low=price, close=price)
+            )
+        else:
+            raise ValueError(f"tipo de registro desconocido {kind!r}")
+
+    def fetch_daily(self) -> list[Candle]:
+        return list(self.daily)
+
+    def latest_price(self) -> Candle:
+        if self._cursor >= len(self.quotes):
+            raise RecordingExhausted()
+        candle = self.quotes[self._cursor]
+        self._cursor += 1
+        return candle
+
+
+class VirtualClock:
+    """Reloj simulado: ``sleep`` avanza el tiempo sin bloquear."""
+
+    def __init__(self) -> None:
+        self.elapsed = timedelta()
+
+    def sleep(self, seconds: float) -> None:
+        self.elapsed += timedelta(seconds=seconds)